@@ -39,9 +39,13 @@ SENTIMENT_SETTINGS = {
     'enable_textblob': True,
     'enable_vader': True,
     'consensus_method': 'strongest_signal',  # 'majority_vote' or 'strongest_signal'
+    'textblob_engine': 'textblob',  # 'textblob' (exact) or 'fast' (lexicon average, for large batches)
 }
 
 # Time analysis settings
+TIME_PERIOD_CHOICES = ('1H', '1D', '1W', '1M')  # in the order shown to users
+VALID_TIME_PERIODS = frozenset(TIME_PERIOD_CHOICES)
+
 TIME_ANALYSIS = {
     'time_period': '1H',  # Group by: '1H' (hour), '1D' (day), '1W' (week)
     'timezone': 'UTC'
@@ -141,6 +145,14 @@ PRESETS = {
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Built once at import; the presets don't change while the program runs
+_PRESETS_KEYS_STR = ', '.join(PRESETS)
+_PRESETS_HELP = ("Available configuration presets:\n"
+                 + "=" * 50 + "\n"
+                 + '\n'.join(f"🔹 {name}: {config['description']}"
+                             for name, config in PRESETS.items())
+                 + "\n\nUsage: config.get_preset('preset_name')")
+
 def get_preset(preset_name):
     """
     Get a predefined configuration preset.
@@ -154,39 +166,29 @@ def get_preset(preset_name):
     if preset_name in PRESETS:
         return PRESETS[preset_name]
     else:
-        available = ', '.join(PRESETS.keys())
-        raise ValueError(f"Preset '{preset_name}' not found. Available presets: {available}")
+        raise ValueError(f"Preset '{preset_name}' not found. Available presets: {_PRESETS_KEYS_STR}")
 
 def list_presets():
     """List all available configuration presets."""
-    print("Available configuration presets:")
-    print("=" * 50)
-    for name, config in PRESETS.items():
-        print(f"🔹 {name}: {config['description']}")
-    print("\nUsage: config.get_preset('preset_name')")
+    print(_PRESETS_HELP)
+
+# Checks run by validate_config: (settings dict name, key, check, problem).
+# Dicts are looked up by name so edits made after import are validated too.
+_VALIDATIONS = (
+    ('REDDIT_CONFIG', 'subreddit', bool, "is required"),
+    ('REDDIT_CONFIG', 'topic', bool, "is required"),
+    ('REDDIT_CONFIG', 'limit', lambda value: (value or 0) > 0, "must be greater than 0"),
+    ('OUTPUT_SETTINGS', 'output_directory', bool, "is required"),
+    ('TIME_ANALYSIS', 'time_period', lambda value: value in VALID_TIME_PERIODS,
+     f"must be one of: {list(TIME_PERIOD_CHOICES)}"),
+)
 
 def validate_config():
     """Validate the current configuration settings."""
-    issues = []
-    
-    # Check required fields
-    if not REDDIT_CONFIG.get('subreddit'):
-        issues.append("REDDIT_CONFIG['subreddit'] is required")
-    
-    if not REDDIT_CONFIG.get('topic'):
-        issues.append("REDDIT_CONFIG['topic'] is required")
-    
-    if REDDIT_CONFIG.get('limit', 0) <= 0:
-        issues.append("REDDIT_CONFIG['limit'] must be greater than 0")
-    
-    # Check output directory
-    if not OUTPUT_SETTINGS.get('output_directory'):
-        issues.append("OUTPUT_SETTINGS['output_directory'] is required")
-    
-    # Check time period format
-    valid_periods = ['1H', '1D', '1W', '1M']
-    if TIME_ANALYSIS.get('time_period') not in valid_periods:
-        issues.append(f"TIME_ANALYSIS['time_period'] must be one of: {valid_periods}")
+    settings = globals()
+    issues = [f"{name}['{key}'] {problem}"
+              for name, key, check, problem in _VALIDATIONS
+              if not check(settings[name].get(key))]
     
     if issues:
         print("❌ Configuration issues found:")
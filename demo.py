@@ -12,10 +12,57 @@ Usage:
     python demo.py
 """
 
+import numpy as np
 import pandas as pd
 from web_scraper import WebScraper
 from sentiment_analyzer import SentimentAnalyzer
-from visualizer import SentimentVisualizer
+
+# Sample posts about climate change (demo 1)
+CLIMATE_TEXTS = (
+    "Climate change is the most urgent crisis of our time. We need immediate action!",
+    "I'm skeptical about climate change. The science isn't settled yet.",
+    "Renewable energy is becoming more affordable and efficient every year.",
+    "The latest climate report shows alarming trends in global temperatures.",
+    "Electric vehicles are a step in the right direction for reducing emissions.",
+    "Climate policies are hurting the economy and killing jobs.",
+    "We need to invest more in green technology and sustainable practices.",
+    "The climate activists are being too alarmist about everything.",
+    "Solar and wind power are now cheaper than fossil fuels in many regions.",
+    "Climate change is a natural cycle that has happened before in history."
+)
+
+# Texts with varied sentiments (demo 2)
+MIXED_TEXTS = (
+    "I absolutely love this new technology! It's fantastic!",
+    "This is terrible. I hate how complicated everything is.",
+    "The weather is okay today, nothing special.",
+    "Amazing breakthrough in science! This will change everything!",
+    "I'm really disappointed with the service quality.",
+    "The presentation was informative and well-structured.",
+    "This is the worst experience I've ever had!",
+    "Pretty good results, could be better though.",
+    "Outstanding performance! Exceeded all my expectations!",
+    "Not impressed at all. Very mediocre quality."
+)
+
+# You can replace this with your own text data (demo 3)
+YOUR_TEXTS = (
+    "Enter your own text here for analysis",
+    "Add as many texts as you want to analyze",
+    "The sentiment analyzer will process all of them",
+    "You can analyze reviews, comments, surveys, etc.",
+    "This is a flexible tool for any text analysis needs"
+)
+
+# Test texts with clear sentiments and their expected label (demo 4)
+TEST_CASES = (
+    ("I love this so much! It's absolutely amazing!", "positive"),
+    ("This is terrible and I hate it completely.", "negative"),
+    ("The weather is fine today.", "neutral"),
+    ("OMG this is AWESOME!!! 😍❤️", "positive"),
+    ("Ugh, this sucks badly 😠", "negative"),
+    ("It's okay, I guess. Not bad, not great.", "neutral")
+)
 
 def demo_custom_topic():
     """Demo: Analyze sentiment about a different topic"""
@@ -25,35 +72,19 @@ def demo_custom_topic():
     scraper = WebScraper()
     analyzer = SentimentAnalyzer()
     
-    # Create sample data about climate change
-    climate_texts = [
-        "Climate change is the most urgent crisis of our time. We need immediate action!",
-        "I'm skeptical about climate change. The science isn't settled yet.",
-        "Renewable energy is becoming more affordable and efficient every year.",
-        "The latest climate report shows alarming trends in global temperatures.",
-        "Electric vehicles are a step in the right direction for reducing emissions.",
-        "Climate policies are hurting the economy and killing jobs.",
-        "We need to invest more in green technology and sustainable practices.",
-        "The climate activists are being too alarmist about everything.",
-        "Solar and wind power are now cheaper than fossil fuels in many regions.",
-        "Climate change is a natural cycle that has happened before in history."
-    ]
-    
     # Create DataFrame
-    data = []
-    for i, text in enumerate(climate_texts):
-        data.append({
-            'title': f'Climate Post {i+1}',
-            'text': text,
-            'combined_text': text,
-            'score': '',
-            'timestamp': pd.Timestamp.now(),
-            'source': 'demo',
-            'topic': 'climate change'
-        })
-    
-    df = pd.DataFrame(data)
-    df['cleaned_text'] = df['combined_text'].apply(scraper.clean_text)
+    n = len(CLIMATE_TEXTS)
+    now = pd.Timestamp.now()
+    df = pd.DataFrame({
+        'title': [f'Climate Post {i+1}' for i in range(n)],
+        'text': CLIMATE_TEXTS,
+        'combined_text': CLIMATE_TEXTS,
+        'score': [''] * n,
+        'timestamp': [now] * n,
+        'source': ['demo'] * n,
+        'topic': ['climate change'] * n
+    })
+    df['cleaned_text'] = scraper.clean_series(df['combined_text'])
     
     # Analyze sentiment
     df_with_sentiment = analyzer.analyze_batch(df)
@@ -73,32 +104,18 @@ def demo_custom_visualization():
     print("📊 Demo 2: Creating custom visualizations")
     print("=" * 50)
     
+    # Imported here so the other demos don't pay for loading matplotlib
+    from visualizer import SentimentVisualizer
+    
     analyzer = SentimentAnalyzer()
-    visualizer = SentimentVisualizer()
-    
-    # Create sample data with varied sentiments
-    mixed_texts = [
-        "I absolutely love this new technology! It's fantastic!",
-        "This is terrible. I hate how complicated everything is.",
-        "The weather is okay today, nothing special.",
-        "Amazing breakthrough in science! This will change everything!",
-        "I'm really disappointed with the service quality.",
-        "The presentation was informative and well-structured.",
-        "This is the worst experience I've ever had!",
-        "Pretty good results, could be better though.",
-        "Outstanding performance! Exceeded all my expectations!",
-        "Not impressed at all. Very mediocre quality."
-    ]
+    visualizer = SentimentVisualizer(dpi=150)  # preview quality is enough for the demo
     
     # Create DataFrame
-    data = []
-    for i, text in enumerate(mixed_texts):
-        data.append({
-            'cleaned_text': text,
-            'timestamp': pd.Timestamp.now()
-        })
-    
-    df = pd.DataFrame(data)
+    now = pd.Timestamp.now()
+    df = pd.DataFrame({
+        'cleaned_text': MIXED_TEXTS,
+        'timestamp': [now] * len(MIXED_TEXTS)
+    })
     
     # Analyze sentiment
     df_with_sentiment = analyzer.analyze_batch(df)
@@ -118,20 +135,11 @@ def demo_analyze_custom_data():
     print("📝 Demo 3: Analyzing custom text data")
     print("=" * 50)
     
-    # You can replace this with your own text data
-    your_texts = [
-        "Enter your own text here for analysis",
-        "Add as many texts as you want to analyze",
-        "The sentiment analyzer will process all of them",
-        "You can analyze reviews, comments, surveys, etc.",
-        "This is a flexible tool for any text analysis needs"
-    ]
-    
     analyzer = SentimentAnalyzer()
     
     # Analyze each text individually
     print("Individual sentiment analysis:")
-    for i, text in enumerate(your_texts):
+    for i, text in enumerate(YOUR_TEXTS):
         textblob_result = analyzer.analyze_textblob_sentiment(text)
         vader_result = analyzer.analyze_vader_sentiment(text)
         
@@ -144,16 +152,6 @@ def demo_compare_methods():
     print("⚔️ Demo 4: Comparing TextBlob vs VADER")
     print("=" * 50)
     
-    # Test texts with clear sentiments
-    test_cases = [
-        ("I love this so much! It's absolutely amazing!", "positive"),
-        ("This is terrible and I hate it completely.", "negative"),
-        ("The weather is fine today.", "neutral"),
-        ("OMG this is AWESOME!!! 😍❤️", "positive"),
-        ("Ugh, this sucks badly 😠", "negative"),
-        ("It's okay, I guess. Not bad, not great.", "neutral")
-    ]
-    
     analyzer = SentimentAnalyzer()
     
     print("Comparing sentiment analysis methods:")
@@ -161,28 +159,25 @@ def demo_compare_methods():
     print(f"{'Text':<40} {'Expected':<10} {'TextBlob':<10} {'VADER':<10}")
     print("-" * 70)
     
-    textblob_correct = 0
-    vader_correct = 0
+    # Only the labels are needed, one slot per test case
+    expected_labels = np.array([expected for _, expected in TEST_CASES], dtype=object)
+    tb_labels = np.empty(len(TEST_CASES), dtype=object)
+    vader_labels = np.empty_like(tb_labels)
     
-    for text, expected in test_cases:
-        tb_result = analyzer.analyze_textblob_sentiment(text)
-        vader_result = analyzer.analyze_vader_sentiment(text)
-        
-        tb_sentiment = tb_result['textblob_sentiment']
-        vader_sentiment = vader_result['vader_sentiment']
-        
-        # Check accuracy
-        if tb_sentiment == expected:
-            textblob_correct += 1
-        if vader_sentiment == expected:
-            vader_correct += 1
+    for i, (text, expected) in enumerate(TEST_CASES):
+        tb_sentiment = tb_labels[i] = analyzer.analyze_textblob_label(text)
+        vader_sentiment = vader_labels[i] = analyzer.analyze_vader_label(text)
         
         display_text = text[:35] + "..." if len(text) > 35 else text
         print(f"{display_text:<40} {expected:<10} {tb_sentiment:<10} {vader_sentiment:<10}")
     
+    # Check accuracy
+    textblob_correct = int((tb_labels == expected_labels).sum())
+    vader_correct = int((vader_labels == expected_labels).sum())
+    
     print("-" * 70)
-    print(f"TextBlob accuracy: {textblob_correct}/{len(test_cases)} ({textblob_correct/len(test_cases)*100:.1f}%)")
-    print(f"VADER accuracy: {vader_correct}/{len(test_cases)} ({vader_correct/len(test_cases)*100:.1f}%)")
+    print(f"TextBlob accuracy: {textblob_correct}/{len(TEST_CASES)} ({textblob_correct/len(TEST_CASES)*100:.1f}%)")
+    print(f"VADER accuracy: {vader_correct}/{len(TEST_CASES)} ({vader_correct/len(TEST_CASES)*100:.1f}%)")
     print()
 
 def main():
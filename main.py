@@ -12,21 +12,89 @@ Author: GitHub Copilot
 Date: August 12, 2025
 """
 
-import os
 import sys
 from datetime import datetime, timedelta
 import json
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
 
 # Import our custom modules
 from web_scraper import WebScraper
-from sentiment_analyzer import SentimentAnalyzer
-from visualizer import SentimentVisualizer, HAS_WORDCLOUD
+from sentiment_analyzer import SentimentAnalyzer, aggregate_trends
+from config import PLOT_SETTINGS, PLOT_TYPES, SENTIMENT_SETTINGS
+
+log = logging.getLogger(__name__)
+
+# Plots written to the output directory (saved as <name>.png), mapped to
+# the PLOT_TYPES flag in config.py that enables them
+PLOT_NAMES = {
+    'sentiment_distribution': 'sentiment_distribution',
+    'sentiment_trends': 'time_series',
+    'score_distributions': 'score_distributions',
+    'wordcloud_all': 'word_cloud',
+    'correlation_heatmap': 'correlation_heatmap',
+    'dashboard': 'comprehensive_dashboard'
+}
+
+# Rows formatted per write when saving CSV results
+CSV_CHUNKSIZE = 50000
+
+# Texts used for the sample data when scraping fails
+SAMPLE_TEXTS = (
+    "I love the new AI developments! This technology is amazing and will change everything for the better.",
+    "Artificial intelligence is concerning. We need to be careful about job displacement and privacy.",
+    "The latest AI research shows promising results in healthcare applications.",
+    "Machine learning algorithms are becoming more sophisticated every day.",
+    "I'm worried about the ethical implications of AI in decision making.",
+    "This AI tool helped me solve a complex problem quickly. Very impressed!",
+    "The debate about AI regulation continues among policymakers worldwide.",
+    "Neural networks are fascinating from a technical perspective.",
+    "AI companies need to be more transparent about their data usage.",
+    "The potential of AI in education is enormous and exciting.",
+    "Deep learning models require massive computational resources.",
+    "I think AI will create more jobs than it destroys in the long run.",
+    "The bias in AI systems is a serious problem that needs addressing.",
+    "Automation through AI is transforming manufacturing industries.",
+    "Natural language processing has improved dramatically in recent years.",
+    "I'm excited about the future of AI in creative applications.",
+    "The AI winter was a difficult period for the research community.",
+    "Computer vision technology is enabling new possibilities in robotics.",
+    "AI safety research is crucial for developing beneficial systems.",
+    "The democratization of AI tools is empowering more developers."
+)
+
+def _prepare_df(df):
+    """
+    Clean scraped posts and get them ready for sentiment analysis
+    
+    Args:
+        df (pandas.DataFrame): Raw posts with 'combined_text' and 'timestamp' columns
+        
+    Returns:
+        pandas.DataFrame: Non-empty cleaned posts sorted by timestamp
+    """
+    if df.empty:
+        return df
+    
+    # Clean the text data
+    df['cleaned_text'] = WebScraper.clean_series(df['combined_text'])
+    
+    # Convert timestamp to datetime
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    
+    # Remove empty texts and sort by timestamp with a single row selection
+    keep = np.flatnonzero(df['cleaned_text'].str.len().gt(0).to_numpy(dtype=bool, na_value=False))
+    order = np.argsort(df['timestamp'].to_numpy()[keep], kind='stable')
+    return df.iloc[keep[order]]
 
 def main():
     """Main function to run the web scraper with sentiment analysis"""
     
-    print("🔍 Web Scraper with Sentiment Analysis")
-    print("=" * 50)
+    log.info("🔍 Web Scraper with Sentiment Analysis")
+    log.info("=" * 50)
     
     # Configuration for scraping
     config = {
@@ -45,13 +113,26 @@ def main():
     }
     
     # Initialize components
-    print("🚀 Initializing components...")
+    log.info("🚀 Initializing components...")
     scraper = WebScraper(delay=1)  # 1 second delay between requests
-    analyzer = SentimentAnalyzer()
-    visualizer = SentimentVisualizer()
+    analyzer = SentimentAnalyzer(engine=SENTIMENT_SETTINGS['textblob_engine'])
+    
+    # Create output directory and work out every output path once
+    output_dir = Path("sentiment_analysis_results")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if PLOT_SETTINGS['save_plots']:
+        plot_paths = {name: str(output_dir / f"{name}.png") for name in PLOT_NAMES}
+    else:
+        plot_paths = dict.fromkeys(PLOT_NAMES)
+    
+    # Plots that are enabled and will actually be saved or shown
+    if PLOT_SETTINGS['save_plots'] or PLOT_SETTINGS['show_plots']:
+        enabled_plots = {name for name, plot_type in PLOT_NAMES.items() if PLOT_TYPES[plot_type]}
+    else:
+        enabled_plots = set()
     
     # Step 1: Scrape data
-    print(f"\n📥 Scraping data about '{config['reddit']['topic']}'...")
+    log.info("\n📥 Scraping data about '%s'...", config['reddit']['topic'])
     try:
         # Scrape from Reddit (easier and more reliable than news sites)
         reddit_data = scraper.scrape_reddit_comments(
@@ -61,275 +142,209 @@ def main():
         )
         
         if not reddit_data:
-            print("⚠️  No data found. Let's create some sample data for demonstration...")
+            log.warning("⚠️  No data found. Let's create some sample data for demonstration...")
             reddit_data = create_sample_data()
         
-        print(f"✅ Successfully scraped {len(reddit_data)} posts")
-        
         # Convert to DataFrame and clean
-        import pandas as pd
         df = pd.DataFrame(reddit_data)
         
-        if not df.empty:
-            # Clean the text data
-            df['cleaned_text'] = df['combined_text'].apply(scraper.clean_text)
-            
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            
-            # Remove empty texts
-            df = df[df['cleaned_text'].str.len() > 0]
-            
-            # Sort by timestamp
-            df = df.sort_values('timestamp')
+        log.info("✅ Successfully scraped %s posts", len(df))
+        
+        df = _prepare_df(df)
         
         if df.empty:
-            print("❌ No data to analyze. Exiting...")
+            log.error("❌ No data to analyze. Exiting...")
             return
             
-        print(f"📊 Data cleaned. {len(df)} posts ready for analysis.")
+        log.info("📊 Data cleaned. %s posts ready for analysis.", len(df))
         
     except Exception as e:
-        print(f"❌ Error during scraping: {e}")
-        print("🔄 Using sample data instead...")
-        reddit_data = create_sample_data()
-        
-        # Convert to DataFrame and clean
-        import pandas as pd
-        df = pd.DataFrame(reddit_data)
-        
-        if not df.empty:
-            # Clean the text data
-            df['cleaned_text'] = df['combined_text'].apply(scraper.clean_text)
-            
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            
-            # Remove empty texts
-            df = df[df['cleaned_text'].str.len() > 0]
-            
-            # Sort by timestamp
-            df = df.sort_values('timestamp')
+        log.error("❌ Error during scraping: %s", e)
+        log.info("🔄 Using sample data instead...")
+        df = _prepare_df(pd.DataFrame(create_sample_data()))
     
     # Step 2: Perform sentiment analysis
-    print(f"\n🧠 Analyzing sentiment for {len(df)} texts...")
+    log.info("\n🧠 Analyzing sentiment for %s texts...", len(df))
     df_with_sentiment = analyzer.analyze_batch(df)
     
     # Step 3: Get summary statistics
-    print("\n📈 Generating summary statistics...")
+    log.info("\n📈 Generating summary statistics...")
     summary = analyzer.get_sentiment_summary(df_with_sentiment)
     
     # Print summary
-    print("\n" + "="*50)
-    print("📊 SENTIMENT ANALYSIS RESULTS")
-    print("="*50)
+    log.info("\n" + "="*50)
+    log.info("📊 SENTIMENT ANALYSIS RESULTS")
+    log.info("="*50)
     
     dist = summary['sentiment_distribution']
-    print(f"Total posts analyzed: {len(df_with_sentiment)}")
-    print(f"Positive: {dist['positive']} ({dist['positive_pct']:.1f}%)")
-    print(f"Negative: {dist['negative']} ({dist['negative_pct']:.1f}%)")
-    print(f"Neutral: {dist['neutral']} ({dist['neutral_pct']:.1f}%)")
+    log.info("Total posts analyzed: %s", len(df_with_sentiment))
+    log.info("Positive: %s (%.1f%%)", dist['positive'], dist['positive_pct'])
+    log.info("Negative: %s (%.1f%%)", dist['negative'], dist['negative_pct'])
+    log.info("Neutral: %s (%.1f%%)", dist['neutral'], dist['neutral_pct'])
     
     scores = summary['average_scores']
-    print(f"\nAverage Sentiment Scores:")
-    print(f"TextBlob Polarity: {scores['textblob_polarity']:.3f} (-1 to 1)")
-    print(f"VADER Compound: {scores['vader_compound']:.3f} (-1 to 1)")
-    print(f"TextBlob Subjectivity: {scores['textblob_subjectivity']:.3f} (0 to 1)")
+    log.info("\nAverage Sentiment Scores:")
+    log.info("TextBlob Polarity: %.3f (-1 to 1)", scores['textblob_polarity'])
+    log.info("VADER Compound: %.3f (-1 to 1)", scores['vader_compound'])
+    log.info("TextBlob Subjectivity: %.3f (0 to 1)", scores['textblob_subjectivity'])
     
     # Show most positive and negative examples
-    print(f"\n🟢 Most Positive (Score: {summary['extremes']['most_positive']['score']:.3f}):")
-    print(f"   \"{summary['extremes']['most_positive']['text']}\"")
+    log.info("\n🟢 Most Positive (Score: %.3f):", summary['extremes']['most_positive']['score'])
+    log.info("   \"%s\"", summary['extremes']['most_positive']['text'])
     
-    print(f"\n🔴 Most Negative (Score: {summary['extremes']['most_negative']['score']:.3f}):")
-    print(f"   \"{summary['extremes']['most_negative']['text']}\"")
+    log.info("\n🔴 Most Negative (Score: %.3f):", summary['extremes']['most_negative']['score'])
+    log.info("   \"%s\"", summary['extremes']['most_negative']['text'])
     
     # Step 4: Analyze trends over time
-    print(f"\n📅 Analyzing sentiment trends over time...")
+    log.info("\n📅 Analyzing sentiment trends over time...")
     trend_df = analyzer.analyze_sentiment_over_time(df_with_sentiment, time_period='1H')
     
     if len(trend_df) > 1:
-        print(f"✅ Generated trend analysis for {len(trend_df)} time periods")
+        log.info("✅ Generated trend analysis for %s time periods", len(trend_df))
     else:
         # If not enough time variation, create hourly trends for demo
         trend_df = create_sample_trends(df_with_sentiment)
-        print(f"✅ Generated sample trend analysis for demonstration")
+        log.info("✅ Generated sample trend analysis for demonstration")
     
     # Step 5: Create visualizations
-    print(f"\n📊 Creating visualizations...")
+    if enabled_plots:
+        log.info("\n📊 Creating visualizations...")
+        
+        if not PLOT_SETTINGS['show_plots']:
+            # Plots are only saved, so don't initialize a GUI backend
+            import matplotlib
+            matplotlib.use('Agg')
+        
+        # Imported here so runs without plots never load matplotlib/seaborn
+        from visualizer import SentimentVisualizer, HAS_WORDCLOUD
+        visualizer = SentimentVisualizer(show=PLOT_SETTINGS['show_plots'], dpi=PLOT_SETTINGS['dpi'])
+    else:
+        log.info("\n📊 Skipping visualizations (disabled in config.py)")
     
     try:
-        # Create output directory
-        output_dir = "sentiment_analysis_results"
-        os.makedirs(output_dir, exist_ok=True)
-        
         # Generate plots
-        print("  📈 Creating sentiment distribution plot...")
-        visualizer.plot_sentiment_distribution(
-            df_with_sentiment, 
-            save_path=f"{output_dir}/sentiment_distribution.png"
-        )
+        if 'sentiment_distribution' in enabled_plots:
+            log.info("  📈 Creating sentiment distribution plot...")
+            visualizer.plot_sentiment_distribution(
+                df_with_sentiment, 
+                save_path=plot_paths['sentiment_distribution']
+            )
         
-        if len(trend_df) > 1:
-            print("  📊 Creating time series plot...")
+        if len(trend_df) > 1 and 'sentiment_trends' in enabled_plots:
+            log.info("  📊 Creating time series plot...")
             visualizer.plot_sentiment_over_time(
                 trend_df, 
-                save_path=f"{output_dir}/sentiment_trends.png"
+                save_path=plot_paths['sentiment_trends']
             )
         
-        print("  📋 Creating sentiment scores distribution...")
-        visualizer.plot_sentiment_scores_distribution(
-            df_with_sentiment, 
-            save_path=f"{output_dir}/score_distributions.png"
-        )
-        
-        print("  ☁️  Creating word cloud...")
-        if HAS_WORDCLOUD:
-            visualizer.create_word_cloud(
+        if 'score_distributions' in enabled_plots:
+            log.info("  📋 Creating sentiment scores distribution...")
+            visualizer.plot_sentiment_scores_distribution(
                 df_with_sentiment, 
-                save_path=f"{output_dir}/wordcloud_all.png"
+                save_path=plot_paths['score_distributions']
             )
-        else:
-            print("    Word cloud skipped (package not available)")
         
-        print("  🔥 Creating correlation heatmap...")
-        visualizer.create_sentiment_heatmap(
-            df_with_sentiment, 
-            save_path=f"{output_dir}/correlation_heatmap.png"
-        )
+        if 'wordcloud_all' in enabled_plots:
+            log.info("  ☁️  Creating word cloud...")
+            if HAS_WORDCLOUD:
+                visualizer.create_word_cloud(
+                    df_with_sentiment, 
+                    save_path=plot_paths['wordcloud_all']
+                )
+            else:
+                log.info("    Word cloud skipped (package not available)")
+        
+        if 'correlation_heatmap' in enabled_plots:
+            log.info("  🔥 Creating correlation heatmap...")
+            visualizer.create_sentiment_heatmap(
+                df_with_sentiment, 
+                save_path=plot_paths['correlation_heatmap']
+            )
         
-        if len(trend_df) > 1:
-            print("  🎯 Creating comprehensive dashboard...")
+        if len(trend_df) > 1 and 'dashboard' in enabled_plots:
+            log.info("  🎯 Creating comprehensive dashboard...")
             visualizer.create_comprehensive_dashboard(
                 df_with_sentiment, 
                 trend_df, 
-                save_path=f"{output_dir}/dashboard.png"
+                save_path=plot_paths['dashboard']
             )
         
     except Exception as e:
-        print(f"⚠️  Error creating some visualizations: {e}")
-        print("This might be due to missing GUI support or display issues.")
+        log.warning("⚠️  Error creating some visualizations: %s", e)
+        log.warning("This might be due to missing GUI support or display issues.")
     
     # Step 6: Save results
-    print(f"\n💾 Saving results...")
+    log.info("\n💾 Saving results...")
     
-    # Save data to CSV
-    df_with_sentiment.to_csv(f"{output_dir}/sentiment_analysis_data.csv", index=False)
-    trend_df.to_csv(f"{output_dir}/sentiment_trends.csv", index=False)
+    # Save data to CSV (written in chunks rather than formatted all at once)
+    df_with_sentiment.to_csv(output_dir / "sentiment_analysis_data.csv", index=False,
+                             chunksize=CSV_CHUNKSIZE)
+    trend_df.to_csv(output_dir / "sentiment_trends.csv", index=False, chunksize=CSV_CHUNKSIZE)
     
     # Save summary to JSON
-    with open(f"{output_dir}/sentiment_summary.json", 'w') as f:
-        # Convert numpy types to Python types for JSON serialization
-        json_summary = convert_numpy_types(summary)
-        json.dump(json_summary, f, indent=2, default=str)
+    with open(output_dir / "sentiment_summary.json", 'w') as f:
+        # numpy values are converted by the encoder as it reaches them
+        json.dump(summary, f, indent=2, default=_np_default)
     
-    print(f"✅ Results saved to '{output_dir}' directory")
-    print(f"   - sentiment_analysis_data.csv: Full dataset with sentiment scores")
-    print(f"   - sentiment_trends.csv: Sentiment trends over time")
-    print(f"   - sentiment_summary.json: Summary statistics")
-    print(f"   - *.png: Various visualization plots")
+    log.info("✅ Results saved to '%s' directory", output_dir)
+    log.info("   - sentiment_analysis_data.csv: Full dataset with sentiment scores")
+    log.info("   - sentiment_trends.csv: Sentiment trends over time")
+    log.info("   - sentiment_summary.json: Summary statistics")
+    log.info("   - *.png: Various visualization plots")
     
-    print(f"\n🎉 Analysis complete! Check the '{output_dir}' folder for all results.")
+    log.info("\n🎉 Analysis complete! Check the '%s' folder for all results.", output_dir)
 
 def create_sample_data():
-    """Create sample data for demonstration when scraping fails"""
-    from datetime import datetime, timedelta
-    
-    sample_texts = [
-        "I love the new AI developments! This technology is amazing and will change everything for the better.",
-        "Artificial intelligence is concerning. We need to be careful about job displacement and privacy.",
-        "The latest AI research shows promising results in healthcare applications.",
-        "Machine learning algorithms are becoming more sophisticated every day.",
-        "I'm worried about the ethical implications of AI in decision making.",
-        "This AI tool helped me solve a complex problem quickly. Very impressed!",
-        "The debate about AI regulation continues among policymakers worldwide.",
-        "Neural networks are fascinating from a technical perspective.",
-        "AI companies need to be more transparent about their data usage.",
-        "The potential of AI in education is enormous and exciting.",
-        "Deep learning models require massive computational resources.",
-        "I think AI will create more jobs than it destroys in the long run.",
-        "The bias in AI systems is a serious problem that needs addressing.",
-        "Automation through AI is transforming manufacturing industries.",
-        "Natural language processing has improved dramatically in recent years.",
-        "I'm excited about the future of AI in creative applications.",
-        "The AI winter was a difficult period for the research community.",
-        "Computer vision technology is enabling new possibilities in robotics.",
-        "AI safety research is crucial for developing beneficial systems.",
-        "The democratization of AI tools is empowering more developers."
-    ]
-    
-    sample_data = []
+    """Create sample data (as a dict of columns) for demonstration when scraping fails"""
+    n = len(SAMPLE_TEXTS)
     base_time = datetime.now() - timedelta(hours=12)
     
-    for i, text in enumerate(sample_texts):
-        sample_data.append({
-            'title': f"AI Discussion Post {i+1}",
-            'text': text,
-            'combined_text': text,
-            'score': str(i % 10),
-            'timestamp': (base_time + timedelta(minutes=i*30)).isoformat(),
-            'source': 'sample',
-            'subreddit': 'technology',
-            'topic': 'artificial intelligence'
-        })
-    
-    return sample_data
+    # Column-oriented so pd.DataFrame() can build each column in one go
+    return {
+        'title': [f"AI Discussion Post {i+1}" for i in range(n)],
+        'text': SAMPLE_TEXTS,
+        'combined_text': SAMPLE_TEXTS,
+        'score': [str(i % 10) for i in range(n)],
+        'timestamp': [(base_time + timedelta(minutes=i*30)).isoformat() for i in range(n)],
+        'source': ['sample'] * n,
+        'subreddit': ['technology'] * n,
+        'topic': ['artificial intelligence'] * n
+    }
 
 def create_sample_trends(df):
     """Create sample trend data when there's not enough time variation"""
-    import pandas as pd
-    from datetime import datetime, timedelta
-    
-    # Create hourly data for the last 12 hours
-    trend_data = []
-    base_time = datetime.now() - timedelta(hours=12)
+    if df.empty:
+        return pd.DataFrame()
     
-    # Distribute the existing data across 12 hours
-    posts_per_hour = len(df) // 6  # Spread across 6 hours
-    if posts_per_hour == 0:
-        posts_per_hour = 1
+    # Spread the existing posts over 6 two-hour periods in the last 12 hours:
+    # consecutive rows share a period, and when there are fewer posts than
+    # periods the remaining periods reuse the last post
+    n_periods = 6
+    posts_per_period = max(len(df) // n_periods, 1)
+    positions = np.arange(n_periods * posts_per_period)
+    period_idx = positions // posts_per_period
+    sample = df.iloc[np.minimum(positions, len(df) - 1)]
     
-    for i in range(6):
-        period_time = base_time + timedelta(hours=i*2)
-        
-        # Sample some posts for this time period
-        start_idx = i * posts_per_hour
-        end_idx = min((i + 1) * posts_per_hour, len(df))
-        period_df = df.iloc[start_idx:end_idx] if start_idx < len(df) else df.iloc[-1:]
-        
-        if len(period_df) > 0:
-            sentiment_counts = period_df['consensus_sentiment'].value_counts()
-            
-            trend_data.append({
-                'period': period_time,
-                'total_posts': len(period_df),
-                'positive_count': sentiment_counts.get('positive', 0),
-                'negative_count': sentiment_counts.get('negative', 0),
-                'neutral_count': sentiment_counts.get('neutral', 0),
-                'positive_pct': (sentiment_counts.get('positive', 0) / len(period_df)) * 100,
-                'negative_pct': (sentiment_counts.get('negative', 0) / len(period_df)) * 100,
-                'neutral_pct': (sentiment_counts.get('neutral', 0) / len(period_df)) * 100,
-                'avg_textblob_polarity': period_df['textblob_polarity'].mean(),
-                'avg_vader_compound': period_df['vader_compound'].mean()
-            })
-    
-    return pd.DataFrame(trend_data)
+    # Count sentiments and average scores for every period in one groupby,
+    # then label the periods with two-hour timestamps
+    trends = aggregate_trends(sample.groupby(period_idx))
+    base_time = datetime.now() - timedelta(hours=12)
+    trends['period'] = base_time + pd.to_timedelta(np.arange(len(trends)) * 2, unit='h')
+    return trends
 
-def convert_numpy_types(obj):
-    """Convert numpy types to Python types for JSON serialization"""
-    import numpy as np
+def _np_default(obj):
+    """
+    json.dump fallback for values the encoder can't handle natively
     
-    if isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
+    numpy scalars and arrays both provide tolist() (scalars return the matching
+    Python number), everything else is written as a string.
+    """
+    if hasattr(obj, 'tolist'):
         return obj.tolist()
-    else:
-        return obj
+    return str(obj)
 
 if __name__ == "__main__":
+    # Progress goes to stdout as plain lines; logging.disable(logging.INFO)
+    # silences it for automated runs
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
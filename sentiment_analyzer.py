@@ -3,15 +3,271 @@ import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional numba import for the batch classification kernel
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Maximum number of distinct texts whose scores are remembered per scorer
+CACHE_SIZE = 65536
+
+# Sentiment labels, in the order summary and trend columns are reported
+SENTIMENT_LABELS = ('positive', 'negative', 'neutral')
+
+# Scores beyond these thresholds count as positive/negative
+TEXTBLOB_THRESHOLD = 0.1
+VADER_THRESHOLD = 0.05
+
+# Scores used when an analyzer fails on a text
+TEXTBLOB_DEFAULT_SCORES = (0.0, 0.0)  # polarity, subjectivity
+VADER_DEFAULT_SCORES = (0.0, 0.0, 1.0, 0.0)  # positive, negative, neutral, compound
+
+# What TextBlob and VADER return for blank text, in _score_texts column order
+EMPTY_TEXT_SCORES = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+# Scores for missing texts. They used to be scored as the strings 'nan' or
+# 'None', which carry no sentiment: VADER rates them fully neutral.
+MISSING_TEXT_SCORES = (0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+# Below this many texts analyze_batch scores in-process: starting worker
+# processes would cost more than it saves
+PARALLEL_MIN_ROWS = 2000
+
+# Chunks handed to each worker process, to balance load against IPC overhead
+CHUNKS_PER_WORKER = 4
+
+# Engines analyze_batch can use for the TextBlob columns: 'textblob' runs
+# TextBlob on every text, 'fast' averages TextBlob's word lexicon directly
+TEXTBLOB_ENGINES = ('textblob', 'fast')
+
+# Words looked up in the lexicon by the 'fast' engine
+_WORD_RE = re.compile(r"[\w'-]+")
+
+def _textblob_label(polarity):
+    """Classify a TextBlob polarity score (-1 to 1)"""
+    if polarity > TEXTBLOB_THRESHOLD:
+        return 'positive'
+    elif polarity < -TEXTBLOB_THRESHOLD:
+        return 'negative'
+    return 'neutral'
+
+def _vader_label(compound):
+    """Classify a VADER compound score (-1 to 1)"""
+    if compound >= VADER_THRESHOLD:
+        return 'positive'
+    elif compound <= -VADER_THRESHOLD:
+        return 'negative'
+    return 'neutral'
+
+def _labels(codes):
+    """Wrap label codes from _classify as a categorical of SENTIMENT_LABELS"""
+    return pd.Categorical.from_codes(codes, categories=list(SENTIMENT_LABELS))
+
+def _classify_numpy(polarity, compound):
+    """
+    Classify arrays of scores into label codes (indexes into SENTIMENT_LABELS)
+    
+    Args:
+        polarity (numpy.ndarray): TextBlob polarity scores
+        compound (numpy.ndarray): VADER compound scores
+        
+    Returns:
+        tuple: int8 arrays of TextBlob, VADER and consensus label codes
+    """
+    tb = np.select([polarity > TEXTBLOB_THRESHOLD, polarity < -TEXTBLOB_THRESHOLD],
+                   [0, 1], 2).astype(np.int8)
+    vd = np.select([compound >= VADER_THRESHOLD, compound <= -VADER_THRESHOLD],
+                   [0, 1], 2).astype(np.int8)
+    
+    # Same rule as SentimentAnalyzer._get_consensus_sentiment
+    consensus = np.where((tb == vd) | (np.abs(polarity) > np.abs(compound)), tb, vd)
+    return tb, vd, consensus
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _classify_numba(polarity, compound):
+        """Fused single-pass version of _classify_numpy"""
+        n = len(polarity)
+        tb = np.empty(n, np.int8)
+        vd = np.empty(n, np.int8)
+        consensus = np.empty(n, np.int8)
+        for i in range(n):
+            p = polarity[i]
+            c = compound[i]
+            tb[i] = 0 if p > TEXTBLOB_THRESHOLD else (1 if p < -TEXTBLOB_THRESHOLD else 2)
+            vd[i] = 0 if c >= VADER_THRESHOLD else (1 if c <= -VADER_THRESHOLD else 2)
+            if tb[i] == vd[i] or abs(p) > abs(c):
+                consensus[i] = tb[i]
+            else:
+                consensus[i] = vd[i]
+        return tb, vd, consensus
+    
+    _classify = _classify_numba
+else:
+    _classify = _classify_numpy
+
+def aggregate_trends(grouped):
+    """
+    Aggregate grouped sentiment results into one trend row per non-empty group
+    
+    Args:
+        grouped (pandas.core.groupby.DataFrameGroupBy): Analysis results grouped
+            by time period
+            
+    Returns:
+        pandas.DataFrame: Counts, percentages and average scores per period
+    """
+    totals = grouped.size()
+    totals = totals[totals > 0]
+    
+    # Count sentiments and average scores for every period in one pass each
+    counts = (grouped['consensus_sentiment'].value_counts()
+              .unstack(fill_value=0)
+              .reindex(index=totals.index, columns=list(SENTIMENT_LABELS), fill_value=0))
+    means = grouped[['textblob_polarity', 'vader_compound']].mean().loc[totals.index]
+    pcts = counts.div(totals, axis=0) * 100
+    
+    # Build the result column by column from typed arrays
+    return pd.DataFrame({
+        'period': totals.index,
+        'total_posts': totals.to_numpy(),
+        'positive_count': counts['positive'].to_numpy(),
+        'negative_count': counts['negative'].to_numpy(),
+        'neutral_count': counts['neutral'].to_numpy(),
+        'positive_pct': pcts['positive'].to_numpy(),
+        'negative_pct': pcts['negative'].to_numpy(),
+        'neutral_pct': pcts['neutral'].to_numpy(),
+        'avg_textblob_polarity': means['textblob_polarity'].to_numpy(),
+        'avg_vader_compound': means['vader_compound'].to_numpy()
+    }, copy=False)  # columns are fresh arrays, no need to copy them again
+
+@lru_cache(maxsize=None)
+def _get_vader_analyzer():
+    """Return the VADER analyzer shared by the whole process"""
+    return SentimentIntensityAnalyzer()
+
+# Both scorers are pure functions of the text, so repeated texts (duplicate
+# posts, boilerplate, empty strings) are looked up instead of re-scored
+@lru_cache(maxsize=CACHE_SIZE)
+def _textblob_cached(text):
+    """Return (polarity, subjectivity) for text"""
+    try:
+        # TextBlob re-runs the analyzer on every .sentiment access
+        polarity, subjectivity = TextBlob(text).sentiment  # -1 to 1, 0 to 1
+        return (polarity, subjectivity)
+    except Exception as e:
+        print(f"Error in TextBlob analysis: {e}")
+        return TEXTBLOB_DEFAULT_SCORES
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _vader_cached(text):
+    """Return (positive, negative, neutral, compound) for text"""
+    try:
+        scores = _get_vader_analyzer().polarity_scores(text)
+        return (scores['pos'], scores['neg'], scores['neu'], scores['compound'])
+    except Exception as e:
+        print(f"Error in VADER analysis: {e}")
+        return VADER_DEFAULT_SCORES
+
+@lru_cache(maxsize=None)
+def _textblob_lexicon():
+    """
+    Load TextBlob's English sentiment lexicon as lookup arrays
+    
+    Returns:
+        tuple: (vocabulary, polarity, subjectivity) where vocabulary maps each
+        word to its index in the two float arrays
+    """
+    from textblob.en import sentiment as lexicon
+    
+    vocabulary = {}
+    polarity = []
+    subjectivity = []
+    for word, senses in lexicon.items():
+        # The None entry averages the scores over the word's parts of speech
+        scores = senses.get(None)
+        if scores:
+            vocabulary[word] = len(polarity)
+            polarity.append(scores[0])
+            subjectivity.append(scores[1])
+    
+    return vocabulary, np.array(polarity), np.array(subjectivity)
+
+def _lexicon_textblob_scores(texts):
+    """
+    Approximate TextBlob scores by averaging lexicon scores of known words
+    
+    Unlike TextBlob this ignores negations and intensifiers ("not good",
+    "very good"), so scores differ slightly, but every text is scored with
+    one dictionary lookup per word and a few numpy reductions.
+    
+    Args:
+        texts (numpy.ndarray): Texts to score
+        
+    Returns:
+        numpy.ndarray: (len(texts), 2) array of polarity and subjectivity
+    """
+    vocabulary, polarity, subjectivity = _textblob_lexicon()
+    
+    # (text, word) pairs of every known word occurrence, i.e. the nonzero
+    # entries of the text-by-vocabulary count matrix
+    rows = []
+    cols = []
+    for i, text in enumerate(texts):
+        for word in _WORD_RE.findall(text.lower()):
+            j = vocabulary.get(word)
+            if j is not None:
+                rows.append(i)
+                cols.append(j)
+    rows = np.array(rows, dtype=np.intp)
+    cols = np.array(cols, dtype=np.intp)
+    
+    n = len(texts)
+    counts = np.bincount(rows, minlength=n)
+    known = counts > 0
+    scores = np.zeros((n, 2))
+    for k, weights in enumerate((polarity, subjectivity)):
+        totals = np.bincount(rows, weights=weights[cols], minlength=n)
+        scores[known, k] = totals[known] / counts[known]
+    return scores
+
+# SentimentAnalyzers of a worker process, one per engine, created on the first
+# chunk so the VADER analyzer never has to be pickled
+_worker_analyzers = {}
+
+def _score_chunk(texts, engine):
+    """Score a chunk of texts inside a worker process"""
+    analyzer = _worker_analyzers.get(engine)
+    if analyzer is None:
+        analyzer = _worker_analyzers[engine] = SentimentAnalyzer(engine=engine)
+    return analyzer._score_texts(texts)
+
 class SentimentAnalyzer:
-    def __init__(self):
-        """Initialize the sentiment analyzer with both TextBlob and VADER"""
+    def __init__(self, engine='textblob', verbose=False):
+        """
+        Initialize the sentiment analyzer with both TextBlob and VADER
+        
+        Args:
+            engine (str): How analyze_batch computes the TextBlob columns, one
+                of TEXTBLOB_ENGINES. 'fast' trades a small difference from
+                TextBlob's scores for much faster batches.
+            verbose (bool): Print a line when analyze_batch starts and finishes
+        """
+        if engine not in TEXTBLOB_ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Available engines: {', '.join(TEXTBLOB_ENGINES)}")
+        self.engine = engine
+        self.verbose = verbose
         self.setup_nltk()
-        self.vader_analyzer = SentimentIntensityAnalyzer()
+        self.vader_analyzer = _get_vader_analyzer()
     
     def setup_nltk(self):
         """Download required NLTK data"""
@@ -21,6 +277,41 @@ class SentimentAnalyzer:
             print("Downloading VADER lexicon...")
             nltk.download('vader_lexicon', quiet=True)
     
+    def _textblob_scores(self, text):
+        """Return (polarity, subjectivity) for text"""
+        return _textblob_cached(text)
+    
+    def _vader_scores(self, text):
+        """Return (positive, negative, neutral, compound) for text"""
+        return _vader_cached(text)
+    
+    def _score_texts(self, texts):
+        """
+        Score texts in this process
+        
+        Returns:
+            numpy.ndarray: (len(texts), 6) array of polarity, subjectivity,
+            positive, negative, neutral and compound scores
+        """
+        if self.engine == 'fast':
+            vader_scores = np.array([self._vader_scores(text) for text in texts],
+                                    dtype=np.float64).reshape(-1, 4)
+            return np.hstack([_lexicon_textblob_scores(texts), vader_scores])
+        
+        return np.array([self._textblob_scores(text) + self._vader_scores(text) for text in texts],
+                        dtype=np.float64).reshape(-1, 6)
+    
+    def _score_texts_parallel(self, texts):
+        """Score texts like _score_texts, splitting large inputs across CPU cores"""
+        workers = os.cpu_count() or 1
+        if len(texts) < PARALLEL_MIN_ROWS or workers < 2:
+            return self._score_texts(texts)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = np.array_split(texts, workers * CHUNKS_PER_WORKER)
+            parts = list(executor.map(_score_chunk, chunks, [self.engine] * len(chunks)))
+        return np.vstack(parts)
+    
     def analyze_textblob_sentiment(self, text):
         """
         Analyze sentiment using TextBlob
@@ -31,31 +322,12 @@ class SentimentAnalyzer:
         Returns:
             dict: Sentiment scores and classification
         """
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity  # -1 to 1
-            subjectivity = blob.sentiment.subjectivity  # 0 to 1
-            
-            # Classify sentiment
-            if polarity > 0.1:
-                sentiment = 'positive'
-            elif polarity < -0.1:
-                sentiment = 'negative'
-            else:
-                sentiment = 'neutral'
-            
-            return {
-                'textblob_polarity': polarity,
-                'textblob_subjectivity': subjectivity,
-                'textblob_sentiment': sentiment
-            }
-        except Exception as e:
-            print(f"Error in TextBlob analysis: {e}")
-            return {
-                'textblob_polarity': 0,
-                'textblob_subjectivity': 0,
-                'textblob_sentiment': 'neutral'
-            }
+        polarity, subjectivity = self._textblob_scores(text)
+        return {
+            'textblob_polarity': polarity,
+            'textblob_subjectivity': subjectivity,
+            'textblob_sentiment': _textblob_label(polarity)
+        }
     
     def analyze_vader_sentiment(self, text):
         """
@@ -67,34 +339,38 @@ class SentimentAnalyzer:
         Returns:
             dict: VADER sentiment scores and classification
         """
-        try:
-            scores = self.vader_analyzer.polarity_scores(text)
+        positive, negative, neutral, compound = self._vader_scores(text)
+        return {
+            'vader_positive': positive,
+            'vader_negative': negative,
+            'vader_neutral': neutral,
+            'vader_compound': compound,
+            'vader_sentiment': _vader_label(compound)
+        }
+    
+    def analyze_textblob_label(self, text):
+        """
+        Classify text with TextBlob without building the full result dict
+        
+        Args:
+            text (str): Text to analyze
             
-            # Classify sentiment based on compound score
-            compound = scores['compound']
-            if compound >= 0.05:
-                sentiment = 'positive'
-            elif compound <= -0.05:
-                sentiment = 'negative'
-            else:
-                sentiment = 'neutral'
+        Returns:
+            str: 'positive', 'negative' or 'neutral'
+        """
+        return _textblob_label(self._textblob_scores(text)[0])
+    
+    def analyze_vader_label(self, text):
+        """
+        Classify text with VADER without building the full result dict
+        
+        Args:
+            text (str): Text to analyze
             
-            return {
-                'vader_positive': scores['pos'],
-                'vader_negative': scores['neg'],
-                'vader_neutral': scores['neu'],
-                'vader_compound': compound,
-                'vader_sentiment': sentiment
-            }
-        except Exception as e:
-            print(f"Error in VADER analysis: {e}")
-            return {
-                'vader_positive': 0,
-                'vader_negative': 0,
-                'vader_neutral': 1,
-                'vader_compound': 0,
-                'vader_sentiment': 'neutral'
-            }
+        Returns:
+            str: 'positive', 'negative' or 'neutral'
+        """
+        return _vader_label(self._vader_scores(text)[3])
     
     def analyze_batch(self, df, text_column='cleaned_text'):
         """
@@ -107,39 +383,63 @@ class SentimentAnalyzer:
         Returns:
             pandas.DataFrame: DataFrame with sentiment analysis results
         """
-        print(f"Analyzing sentiment for {len(df)} texts...")
+        if self.verbose:
+            print(f"Analyzing sentiment for {len(df)} texts...")
         
-        # Initialize result lists
-        textblob_results = []
-        vader_results = []
+        # Start each batch with empty caches to bound memory across batches
+        _textblob_cached.cache_clear()
+        _vader_cached.cache_clear()
         
-        for idx, text in enumerate(df[text_column]):
-            if idx % 10 == 0:
-                print(f"Processing {idx}/{len(df)}...")
-            
-            # Analyze with TextBlob
-            tb_result = self.analyze_textblob_sentiment(str(text))
-            textblob_results.append(tb_result)
-            
-            # Analyze with VADER
-            vader_result = self.analyze_vader_sentiment(str(text))
-            vader_results.append(vader_result)
+        # Pandas' string dtype (arrow-backed when pyarrow is the configured
+        # string storage) runs the .str scans below without a Python call per
+        # row, and the result keeps the converted column.
+        df = df.assign(**{text_column: df[text_column].astype('string')})
+        is_missing = df[text_column].isna().to_numpy()
+        has_text = (df[text_column].str.strip().str.len().gt(0)
+                    .to_numpy(dtype=bool, na_value=False))
+        texts = df[text_column].to_numpy(dtype=object)
+        
+        # Score every text into an (N, 6) float array, then derive labels for
+        # the whole column at once. TextBlob and VADER are pure Python and
+        # CPU-bound, so large batches are scored across worker processes.
+        # Blank texts keep EMPTY_TEXT_SCORES and missing ones get
+        # MISSING_TEXT_SCORES, without reaching either scorer.
+        scores = np.tile(np.array(EMPTY_TEXT_SCORES, dtype=np.float64), (len(texts), 1))
+        scores[is_missing] = MISSING_TEXT_SCORES
+        if has_text.any():
+            scores[has_text] = self._score_texts_parallel(texts[has_text])
+        polarity, subjectivity, positive, negative, neutral, compound = scores.T
         
-        # Convert results to DataFrames and merge
-        textblob_df = pd.DataFrame(textblob_results)
-        vader_df = pd.DataFrame(vader_results)
+        # Label codes for TextBlob, VADER and their consensus in one pass
+        tb_codes, vader_codes, consensus_codes = _classify(polarity, compound)
         
-        # Combine with original DataFrame
-        result_df = pd.concat([df.reset_index(drop=True), textblob_df, vader_df], axis=1)
+        # Add the result columns to a copy of the input instead of
+        # concatenating frames. Labels are stored as categoricals built
+        # straight from the int8 codes.
+        result_df = df.reset_index(drop=True)
+        result_df['textblob_polarity'] = polarity
+        result_df['textblob_subjectivity'] = subjectivity
+        result_df['textblob_sentiment'] = _labels(tb_codes)
+        result_df['vader_positive'] = positive
+        result_df['vader_negative'] = negative
+        result_df['vader_neutral'] = neutral
+        result_df['vader_compound'] = compound
+        result_df['vader_sentiment'] = _labels(vader_codes)
         
         # Add consensus sentiment (majority vote between TextBlob and VADER)
-        result_df['consensus_sentiment'] = result_df.apply(self._get_consensus_sentiment, axis=1)
+        result_df['consensus_sentiment'] = _labels(consensus_codes)
         
-        print("Sentiment analysis completed!")
+        if self.verbose:
+            print("Sentiment analysis completed!")
         return result_df
     
     def _get_consensus_sentiment(self, row):
-        """Get consensus sentiment between TextBlob and VADER"""
+        """
+        Get consensus sentiment between TextBlob and VADER for a single row
+        
+        analyze_batch applies the same rule to whole columns with np.where;
+        this row-wise version is kept for callers working with single rows.
+        """
         tb_sentiment = row['textblob_sentiment']
         vader_sentiment = row['vader_sentiment']
         
@@ -167,45 +467,42 @@ class SentimentAnalyzer:
         """
         summary = {}
         
-        # Overall sentiment distribution
-        sentiment_counts = df['consensus_sentiment'].value_counts()
-        total_count = len(df)
+        # Overall sentiment distribution, counted once
+        sentiment_counts = (df['consensus_sentiment'].value_counts()
+                            .reindex(list(SENTIMENT_LABELS), fill_value=0))
+        sentiment_pcts = sentiment_counts / len(df) * 100
         
         summary['sentiment_distribution'] = {
-            'positive': sentiment_counts.get('positive', 0),
-            'negative': sentiment_counts.get('negative', 0),
-            'neutral': sentiment_counts.get('neutral', 0),
-            'positive_pct': (sentiment_counts.get('positive', 0) / total_count) * 100,
-            'negative_pct': (sentiment_counts.get('negative', 0) / total_count) * 100,
-            'neutral_pct': (sentiment_counts.get('neutral', 0) / total_count) * 100
+            'positive': sentiment_counts['positive'],
+            'negative': sentiment_counts['negative'],
+            'neutral': sentiment_counts['neutral'],
+            'positive_pct': sentiment_pcts['positive'],
+            'negative_pct': sentiment_pcts['negative'],
+            'neutral_pct': sentiment_pcts['neutral']
         }
         
-        # Average sentiment scores
-        summary['average_scores'] = {
-            'textblob_polarity': df['textblob_polarity'].mean(),
-            'textblob_subjectivity': df['textblob_subjectivity'].mean(),
-            'vader_compound': df['vader_compound'].mean(),
-            'vader_positive': df['vader_positive'].mean(),
-            'vader_negative': df['vader_negative'].mean()
-        }
+        # Average sentiment scores, in one pass over the score columns
+        summary['average_scores'] = df[['textblob_polarity', 'textblob_subjectivity', 'vader_compound',
+                                        'vader_positive', 'vader_negative']].mean().to_dict()
         
-        # Most positive and negative texts
-        most_positive_idx = df['vader_compound'].idxmax()
-        most_negative_idx = df['vader_compound'].idxmin()
+        # Most positive and negative texts, each row read once with .at
+        extreme_idx = df['vader_compound'].agg(['idxmax', 'idxmin'])
         
         summary['extremes'] = {
-            'most_positive': {
-                'text': df.loc[most_positive_idx, 'cleaned_text'][:200] + "..." if len(df.loc[most_positive_idx, 'cleaned_text']) > 200 else df.loc[most_positive_idx, 'cleaned_text'],
-                'score': df.loc[most_positive_idx, 'vader_compound']
-            },
-            'most_negative': {
-                'text': df.loc[most_negative_idx, 'cleaned_text'][:200] + "..." if len(df.loc[most_negative_idx, 'cleaned_text']) > 200 else df.loc[most_negative_idx, 'cleaned_text'],
-                'score': df.loc[most_negative_idx, 'vader_compound']
-            }
+            'most_positive': self._extreme_entry(df, extreme_idx['idxmax']),
+            'most_negative': self._extreme_entry(df, extreme_idx['idxmin'])
         }
         
         return summary
     
+    def _extreme_entry(self, df, idx):
+        """Return the text snippet (up to 200 characters) and score of row idx"""
+        text = df.at[idx, 'cleaned_text']
+        return {
+            'text': text[:200] + "..." if len(text) > 200 else text,
+            'score': df.at[idx, 'vader_compound']
+        }
+    
     def analyze_sentiment_over_time(self, df, time_period='1D'):
         """
         Analyze sentiment trends over time
@@ -217,29 +514,13 @@ class SentimentAnalyzer:
         Returns:
             pandas.DataFrame: Sentiment trends over time
         """
-        # Ensure timestamp is datetime
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        # Ensure timestamp is datetime, converting a copy so the caller's
+        # frame is left alone
+        if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            df = df.assign(timestamp=pd.to_datetime(df['timestamp']))
+        
+        if df.empty:
+            return pd.DataFrame()
         
         # Group by time period
-        time_groups = df.groupby(pd.Grouper(key='timestamp', freq=time_period))
-        
-        trend_data = []
-        
-        for period, group in time_groups:
-            if len(group) > 0:
-                sentiment_counts = group['consensus_sentiment'].value_counts()
-                
-                trend_data.append({
-                    'period': period,
-                    'total_posts': len(group),
-                    'positive_count': sentiment_counts.get('positive', 0),
-                    'negative_count': sentiment_counts.get('negative', 0),
-                    'neutral_count': sentiment_counts.get('neutral', 0),
-                    'positive_pct': (sentiment_counts.get('positive', 0) / len(group)) * 100,
-                    'negative_pct': (sentiment_counts.get('negative', 0) / len(group)) * 100,
-                    'neutral_pct': (sentiment_counts.get('neutral', 0) / len(group)) * 100,
-                    'avg_textblob_polarity': group['textblob_polarity'].mean(),
-                    'avg_vader_compound': group['vader_compound'].mean()
-                })
-        
-        return pd.DataFrame(trend_data)
+        return aggregate_trends(df.groupby(pd.Grouper(key='timestamp', freq=time_period)))
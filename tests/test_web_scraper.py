@@ -0,0 +1,46 @@
+import io
+import unittest
+from unittest import mock
+
+import requests
+from urllib3.response import HTTPResponse
+
+from web_scraper import WebScraper
+
+
+def _html_response(body, content_type):
+    """Build a streamed requests.Response carrying body as its raw bytes"""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    return response
+
+
+class FetchTreeEncodingTest(unittest.TestCase):
+    HEADLINE = "Café société — AI überall"
+    
+    def scrape(self, body, content_type):
+        scraper = WebScraper(delay=0)
+        with mock.patch.object(scraper, '_polite_get', return_value=_html_response(body, content_type)):
+            news = scraper.scrape_news_headlines('AI', source_urls=['https://example.com/'])
+        return [item['title'] for item in news]
+    
+    def test_header_charset_without_meta_tag(self):
+        body = f"<html><body><h1>{self.HEADLINE}</h1></body></html>".encode('utf-8')
+        self.assertEqual(self.scrape(body, 'text/html; charset=utf-8'), [self.HEADLINE])
+    
+    def test_non_utf8_header_charset(self):
+        headline = "Café société, AI überall"
+        body = f"<html><body><h1>{headline}</h1></body></html>".encode('iso-8859-1')
+        self.assertEqual(self.scrape(body, 'text/html; charset=ISO-8859-1'), [headline])
+    
+    def test_meta_charset_without_header_charset(self):
+        body = (f'<html><head><meta charset="utf-8"></head>'
+                f'<body><h1>{self.HEADLINE}</h1></body></html>').encode('utf-8')
+        self.assertEqual(self.scrape(body, 'text/html'), [self.HEADLINE])
+
+
+if __name__ == '__main__':
+    unittest.main()
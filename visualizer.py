@@ -1,32 +1,147 @@
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+import re
+from collections import Counter
+from itertools import chain
 import warnings
 warnings.filterwarnings('ignore')
 
 # Optional wordcloud import
 try:
-    from wordcloud import WordCloud
+    from wordcloud import WordCloud, STOPWORDS
     HAS_WORDCLOUD = True
 except ImportError:
     HAS_WORDCLOUD = False
     print("Note: wordcloud package not available. Word cloud functionality disabled.")
 
+# Words as WordCloud tokenizes them by default (min_word_length=0)
+_WORD_RE = re.compile(r"\w[\w']*")
+
+def _word_frequencies(texts):
+    """
+    Count words the way WordCloud.process_text does without collocations
+    
+    Trailing "'s" is removed, all-digit tokens and STOPWORDS are dropped, and
+    a plural ending in a single "s" is merged into its singular when both
+    occur ("models" counts towards "model").
+    
+    Args:
+        texts (iterable): Lowercased texts
+        
+    Returns:
+        collections.Counter: Count of each word
+    """
+    words = (word[:-2] if word.endswith("'s") else word
+             for word in chain.from_iterable(map(_WORD_RE.findall, texts)))
+    counts = Counter(word for word in words if not word.isdigit() and word not in STOPWORDS)
+    
+    for word in list(counts):
+        if word.endswith('s') and not word.endswith('ss') and word[:-1] in counts:
+            counts[word[:-1]] += counts.pop(word)
+    return counts
+
+# Whether the global matplotlib style and seaborn palette have been set
+_STYLE_APPLIED = False
+
+def _apply_style():
+    """Set the plot style and palette once per process"""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        plt.style.use('default')  # Use default style as seaborn-v0_8 might not be available
+        sns.set_palette("husl")
+        _STYLE_APPLIED = True
+
+# Score columns of the full correlation heatmap
+SCORE_COLUMNS = ['textblob_polarity', 'textblob_subjectivity',
+                 'vader_compound', 'vader_positive', 'vader_negative', 'vader_neutral']
+
+# Label column of each analysis method, with the name shown in plots
+METHOD_COLUMNS = {
+    'textblob_sentiment': 'TextBlob',
+    'vader_sentiment': 'VADER',
+    'consensus_sentiment': 'Consensus'
+}
+
 class SentimentVisualizer:
-    def __init__(self, style='seaborn-v0_8', figsize=(12, 8)):
+    def __init__(self, style='seaborn-v0_8', figsize=(12, 8), show=True, dpi=300):
         """
         Initialize the sentiment visualizer
         
         Args:
             style (str): Matplotlib style to use
             figsize (tuple): Default figure size
+            show (bool): Display each plot after creating it
+            dpi (int): Resolution for saved plots
         """
-        plt.style.use('default')  # Use default style as seaborn-v0_8 might not be available
-        sns.set_palette("husl")
+        _apply_style()
         self.figsize = figsize
+        self.show = show
+        self.dpi = dpi
+        
+        # Correlation matrix of the last frame plotted, with the key it was
+        # computed for
+        self._corr_key = None
+        self._corr = None
+    
+    def _score_correlations(self, df):
+        """
+        Return the correlation matrix of SCORE_COLUMNS for df, cached per frame
         
+        The heatmap and the dashboard both need it, so a pipeline drawing both
+        computes it once. The cache key combines the frame identity with its
+        length and column sums, so a modified frame is not mistaken for the
+        previous one.
+        """
+        scores = df[SCORE_COLUMNS]
+        key = (id(df), len(df), tuple(scores.sum()))
+        if key != self._corr_key:
+            self._corr = scores.corr()
+            self._corr_key = key
+        return self._corr
+    
+    def _new_figure(self, figsize):
+        """
+        Create a figure for one plot
+        
+        Figures are only registered with pyplot when they are going to be
+        shown; otherwise they are rendered directly on an Agg canvas, without
+        pyplot's figure manager or an interactive backend.
+        """
+        if self.show:
+            return plt.figure(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig
+    
+    def _finish(self, fig, save_path, message):
+        """Save fig when save_path is given, then show and release it"""
+        if save_path:
+            fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            print(f"{message}: {save_path}")
+        
+        if self.show:
+            plt.show()
+            plt.close(fig)
+        
+    def _method_counts(self, df, columns):
+        """
+        Count sentiment labels per analysis method in a single aggregation
+        
+        Args:
+            df (pandas.DataFrame): DataFrame with sentiment analysis results
+            columns (list): Label columns to count, keys of METHOD_COLUMNS
+            
+        Returns:
+            pandas.DataFrame: Counts with one row per sentiment that occurs
+            and one column per method, in the order of columns
+        """
+        counts = (df[columns].melt(var_name='method', value_name='sentiment')
+                  .pivot_table(index='sentiment', columns='method', aggfunc='size',
+                               fill_value=0, observed=True))
+        return counts.reindex(columns=columns, fill_value=0).rename(columns=METHOD_COLUMNS)
+    
     def plot_sentiment_distribution(self, df, save_path=None):
         """
         Create a pie chart showing sentiment distribution
@@ -35,10 +150,12 @@ class SentimentVisualizer:
             df (pandas.DataFrame): DataFrame with sentiment analysis results
             save_path (str): Path to save the plot (optional)
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=self.figsize)
+        fig = self._new_figure(self.figsize)
+        ax1, ax2 = fig.subplots(1, 2)
         
         # Pie chart for overall sentiment distribution
         sentiment_counts = df['consensus_sentiment'].value_counts()
+        sentiment_counts = sentiment_counts[sentiment_counts > 0]  # categoricals count unused labels too
         colors = ['#2ecc71', '#e74c3c', '#95a5a6']  # Green, Red, Gray
         
         ax1.pie(sentiment_counts.values, labels=sentiment_counts.index, autopct='%1.1f%%',
@@ -46,13 +163,7 @@ class SentimentVisualizer:
         ax1.set_title('Overall Sentiment Distribution', fontsize=14, fontweight='bold')
         
         # Bar chart for sentiment comparison between methods
-        methods_data = {
-            'TextBlob': df['textblob_sentiment'].value_counts(),
-            'VADER': df['vader_sentiment'].value_counts(),
-            'Consensus': df['consensus_sentiment'].value_counts()
-        }
-        
-        methods_df = pd.DataFrame(methods_data).fillna(0)
+        methods_df = self._method_counts(df, list(METHOD_COLUMNS))
         methods_df.plot(kind='bar', ax=ax2, color=['#3498db', '#f39c12', '#9b59b6'])
         ax2.set_title('Sentiment Analysis Method Comparison', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Sentiment')
@@ -60,13 +171,9 @@ class SentimentVisualizer:
         ax2.legend(title='Method')
         ax2.tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Sentiment distribution plot saved to: {save_path}")
+        fig.tight_layout()
         
-        plt.show()
+        self._finish(fig, save_path, "Sentiment distribution plot saved to")
         
     def plot_sentiment_over_time(self, trend_df, save_path=None):
         """
@@ -76,7 +183,8 @@ class SentimentVisualizer:
             trend_df (pandas.DataFrame): DataFrame with sentiment trends over time
             save_path (str): Path to save the plot (optional)
         """
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+        fig = self._new_figure((15, 10))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
         # Plot 1: Sentiment percentages over time
         ax1.plot(trend_df['period'], trend_df['positive_pct'], marker='o', 
@@ -124,13 +232,9 @@ class SentimentVisualizer:
         for ax in [ax1, ax2, ax3, ax4]:
             ax.tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Time series plot saved to: {save_path}")
+        fig.tight_layout()
         
-        plt.show()
+        self._finish(fig, save_path, "Time series plot saved to")
         
     def plot_sentiment_scores_distribution(self, df, save_path=None):
         """
@@ -140,7 +244,8 @@ class SentimentVisualizer:
             df (pandas.DataFrame): DataFrame with sentiment analysis results
             save_path (str): Path to save the plot (optional)
         """
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=self.figsize)
+        fig = self._new_figure(self.figsize)
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
         # TextBlob polarity distribution
         ax1.hist(df['textblob_polarity'], bins=30, alpha=0.7, color='#3498db', edgecolor='black')
@@ -183,13 +288,9 @@ class SentimentVisualizer:
         ax4.set_xticklabels(['Positive', 'Negative', 'Neutral'])
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Score distribution plot saved to: {save_path}")
-        
-        plt.show()
+        self._finish(fig, save_path, "Score distribution plot saved to")
         
     def create_word_cloud(self, df, sentiment_filter=None, save_path=None):
         """
@@ -215,25 +316,27 @@ class SentimentVisualizer:
             print(f"No data available for sentiment: {sentiment_filter}")
             return
         
-        # Combine all text
-        text = ' '.join(filtered_df['cleaned_text'].astype(str))
+        # Count words per text instead of joining the whole column into one
+        # string for WordCloud to tokenize again
+        frequencies = _word_frequencies(filtered_df['cleaned_text'].astype(str).str.lower())
+        
+        if not frequencies:
+            print(f"No words to draw for sentiment: {sentiment_filter}")
+            return
         
         # Create word cloud
         wordcloud = WordCloud(width=800, height=400, 
                              background_color='white',
                              max_words=100,
-                             colormap='viridis').generate(text)
-        
-        plt.figure(figsize=(12, 6))
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.title(title, fontsize=16, fontweight='bold')
-        plt.axis('off')
+                             colormap='viridis').generate_from_frequencies(frequencies)
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Word cloud saved to: {save_path}")
+        fig = self._new_figure((12, 6))
+        ax = fig.subplots()
+        ax.imshow(wordcloud, interpolation='bilinear')
+        ax.set_title(title, fontsize=16, fontweight='bold')
+        ax.axis('off')
         
-        plt.show()
+        self._finish(fig, save_path, "Word cloud saved to")
         
     def create_sentiment_heatmap(self, df, save_path=None):
         """
@@ -243,23 +346,16 @@ class SentimentVisualizer:
             df (pandas.DataFrame): DataFrame with sentiment analysis results
             save_path (str): Path to save the plot (optional)
         """
-        # Select sentiment score columns
-        sentiment_cols = ['textblob_polarity', 'textblob_subjectivity', 
-                         'vader_compound', 'vader_positive', 'vader_negative', 'vader_neutral']
-        
-        correlation_matrix = df[sentiment_cols].corr()
+        correlation_matrix = self._score_correlations(df)
         
-        plt.figure(figsize=(10, 8))
+        fig = self._new_figure((10, 8))
+        ax = fig.subplots()
         sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
-                   square=True, fmt='.2f', cbar_kws={'shrink': 0.8})
-        plt.title('Sentiment Scores Correlation Heatmap', fontsize=16, fontweight='bold')
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Correlation heatmap saved to: {save_path}")
+                   square=True, fmt='.2f', cbar_kws={'shrink': 0.8}, ax=ax)
+        ax.set_title('Sentiment Scores Correlation Heatmap', fontsize=16, fontweight='bold')
+        fig.tight_layout()
         
-        plt.show()
+        self._finish(fig, save_path, "Correlation heatmap saved to")
         
     def create_comprehensive_dashboard(self, df, trend_df, save_path=None):
         """
@@ -270,14 +366,19 @@ class SentimentVisualizer:
             trend_df (pandas.DataFrame): DataFrame with sentiment trends over time
             save_path (str): Path to save the plot (optional)
         """
-        fig = plt.figure(figsize=(20, 12))
+        fig = self._new_figure((20, 12))
+        
+        # Summaries shared by several panels, each computed once up front
+        sentiment_counts = df['consensus_sentiment'].value_counts()
+        sentiment_counts = sentiment_counts[sentiment_counts > 0]  # categoricals count unused labels too
+        methods_df = self._method_counts(df, ['textblob_sentiment', 'vader_sentiment'])
+        vader_components = df[['vader_positive', 'vader_negative', 'vader_neutral']].mean()
         
         # Create a grid layout
         gs = fig.add_gridspec(3, 4, hspace=0.3, wspace=0.3)
         
         # 1. Sentiment distribution pie chart
         ax1 = fig.add_subplot(gs[0, 0])
-        sentiment_counts = df['consensus_sentiment'].value_counts()
         colors = ['#2ecc71', '#e74c3c', '#95a5a6']
         ax1.pie(sentiment_counts.values, labels=sentiment_counts.index, autopct='%1.1f%%',
                 colors=colors, startangle=90)
@@ -304,11 +405,6 @@ class SentimentVisualizer:
         
         # 4. Method comparison
         ax4 = fig.add_subplot(gs[1, 0])
-        methods_data = {
-            'TextBlob': df['textblob_sentiment'].value_counts(),
-            'VADER': df['vader_sentiment'].value_counts()
-        }
-        methods_df = pd.DataFrame(methods_data).fillna(0)
         methods_df.plot(kind='bar', ax=ax4, color=['#3498db', '#f39c12'])
         ax4.set_title('Method Comparison', fontweight='bold')
         ax4.tick_params(axis='x', rotation=45)
@@ -322,7 +418,6 @@ class SentimentVisualizer:
         
         # 6. VADER components
         ax6 = fig.add_subplot(gs[1, 3])
-        vader_components = df[['vader_positive', 'vader_negative', 'vader_neutral']].mean()
         ax6.bar(range(len(vader_components)), vader_components.values, 
                color=['#2ecc71', '#e74c3c', '#95a5a6'])
         ax6.set_title('Avg VADER Components', fontweight='bold')
@@ -332,7 +427,7 @@ class SentimentVisualizer:
         # 7. Correlation heatmap
         ax7 = fig.add_subplot(gs[2, :2])
         sentiment_cols = ['textblob_polarity', 'vader_compound', 'vader_positive', 'vader_negative']
-        correlation_matrix = df[sentiment_cols].corr()
+        correlation_matrix = self._score_correlations(df).loc[sentiment_cols, sentiment_cols]
         sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
                    square=True, fmt='.2f', ax=ax7, cbar=False)
         ax7.set_title('Sentiment Scores Correlation', fontweight='bold')
@@ -350,10 +445,6 @@ class SentimentVisualizer:
         ax8.grid(True, alpha=0.3)
         ax8.tick_params(axis='x', rotation=45)
         
-        plt.suptitle('Sentiment Analysis Dashboard', fontsize=20, fontweight='bold', y=0.98)
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Dashboard saved to: {save_path}")
+        fig.suptitle('Sentiment Analysis Dashboard', fontsize=20, fontweight='bold', y=0.98)
         
-        plt.show()
+        self._finish(fig, save_path, "Dashboard saved to")
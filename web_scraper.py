@@ -1,10 +1,74 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 import pandas as pd
+import heapq
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from urllib.parse import urljoin, urlparse
-from datetime import datetime
+from datetime import datetime, timezone
+
+# orjson parses Reddit's JSON several times faster; the standard library
+# parser is used when it isn't installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Every rule of WebScraper.clean_text in one pattern, compiled once at import.
+# A match is a maximal run of URLs, special characters (anything but word
+# characters, whitespace and basic punctuation) and whitespace; replacing each
+# run with a single space removes the URLs, blanks the special characters and
+# collapses the whitespace in one scan. Once the ends are stripped this equals
+# applying the rules one after another, because a URL always runs up to
+# whitespace or the end of the text.
+_CLEAN_RE = re.compile(r'(?:https?://\S+|[^\w\s,.!?-]|\s)+')
+
+def _has_class(name):
+    """XPath test for elements whose class attribute contains the token name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Headline elements (you may need to adjust for specific sites): h1-h3 (which
+# covers 'article h1' and 'article h2'), .headline, .title and
+# [data-testid="headline"], as one compiled XPath so each page is walked once
+HEADLINE_XPATH = etree.XPath(
+    f'//h1 | //h2 | //h3 | //*[{_has_class("headline")}] | //*[{_has_class("title")}]'
+    ' | //*[@data-testid="headline"]'
+)
+
+# Columns of the post records built by the scrape_* methods
+POST_COLUMNS = ['title', 'text', 'combined_text', 'score', 'timestamp', 'source', 'subreddit', 'topic']
+
+# Column dtypes of the cleaned frame: the few distinct sources, subreddits
+# and topics are stored once each as categories, and the texts use pandas'
+# dedicated string dtype instead of generic objects
+CLEANED_DTYPES = {
+    'source': 'category',
+    'subreddit': 'category',
+    'topic': 'category',
+    'title': 'string',
+    'text': 'string',
+    'combined_text': 'string',
+    'cleaned_text': 'string'
+}
+
+# Most pages fetched at the same time
+MAX_FETCH_WORKERS = 8
+
+# Connection pooling and retry policy of the shared session
+POOL_CONNECTIONS = 32  # hosts kept in the pool
+POOL_MAXSIZE = 64  # connections kept per host
+RETRY_POLICY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+
+# Reddit search endpoint, and the most results it returns per page
+REDDIT_SEARCH_URL = "https://old.reddit.com/r/{subreddit}/search.json"
+REDDIT_PAGE_SIZE = 100
 
 class WebScraper:
     def __init__(self, delay=1):
@@ -12,13 +76,80 @@ class WebScraper:
         Initialize the web scraper
         
         Args:
-            delay (int): Delay between requests to be respectful to the server
+            delay (int): Delay between requests to the same server, to be respectful
         """
         self.delay = delay
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml',
+            # Every compression urllib3 can decode here: gzip and deflate,
+            # plus br when the brotli package is installed
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
         })
+        
+        # Keep connections to every scraped host alive across requests and
+        # threads, and retry transient failures with backoff
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                              max_retries=RETRY_POLICY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Earliest time (time.monotonic) the next request to each host may
+        # start, shared by the fetch threads
+        self._next_request = {}
+        self._rate_lock = threading.Lock()
+    
+    def _polite_get(self, url, **kwargs):
+        """
+        session.get that keeps self.delay seconds between requests to a host
+        
+        Each host has its own schedule, so requests to different sites never
+        wait for each other. Concurrent requests to the same host reserve
+        consecutive slots.
+        
+        Args:
+            url (str): URL to fetch
+            **kwargs: Extra arguments for requests.Session.get
+            
+        Returns:
+            requests.Response: The response
+        """
+        host = urlparse(url).netloc
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request.get(host, now))
+            self._next_request[host] = start + self.delay
+        
+        if start > now:
+            time.sleep(start - now)
+        return self.session.get(url, **kwargs)
+    
+    def _fetch_tree(self, url, **kwargs):
+        """
+        Fetch a page and parse it while it downloads
+        
+        The body is streamed from the connection into lxml's parser, so the
+        whole page never has to sit in memory as bytes next to the tree.
+        lxml never sees the HTTP headers, so a charset declared in the
+        Content-Type header is passed to the parser explicitly; without one,
+        lxml goes by the page's <meta charset>.
+        
+        Args:
+            url (str): URL to fetch
+            **kwargs: Extra arguments for requests.Session.get, e.g. params
+            
+        Returns:
+            lxml.etree._ElementTree: Parsed document
+        """
+        with self._polite_get(url, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # decompress gzip/deflate bodies on the fly
+            
+            parser = None
+            if 'charset=' in response.headers.get('Content-Type', '').lower():
+                parser = lxml.html.HTMLParser(encoding=response.encoding)
+            return lxml.html.parse(response.raw, parser=parser)
     
     def scrape_reddit_comments(self, subreddit, topic, limit=50):
         """
@@ -34,62 +165,68 @@ class WebScraper:
         """
         posts_data = []
         
-        # Search URL for Reddit
-        search_url = f"https://old.reddit.com/r/{subreddit}/search"
+        # Reddit's JSON search results carry the same fields as the HTML page,
+        # without any markup to parse; raw_json=1 turns off HTML escaping
+        search_url = REDDIT_SEARCH_URL.format(subreddit=subreddit)
         params = {
             'q': topic,
             'restrict_sr': 'on',
             'sort': 'new',
-            'limit': limit
+            'limit': min(limit, REDDIT_PAGE_SIZE),
+            'raw_json': 1
         }
         
         try:
-            response = self.session.get(search_url, params=params)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find all post containers
-            posts = soup.find_all('div', class_='thing')
-            
-            for post in posts[:limit]:
-                try:
-                    # Extract post title
-                    title_element = post.find('a', class_='title')
-                    title = title_element.text.strip() if title_element else ""
-                    
-                    # Extract post text/selftext
-                    text_element = post.find('div', class_='usertext-body')
-                    text = text_element.text.strip() if text_element else ""
-                    
-                    # Extract score
-                    score_element = post.find('div', class_='score unvoted')
-                    score = score_element.text.strip() if score_element else "0"
+            # Reddit serves at most REDDIT_PAGE_SIZE results per page. Each
+            # next page is addressed by the last post of the previous one
+            # (the 'after' cursor), so pages are fetched one after another.
+            seen = 0
+            while seen < limit:
+                # The body is read straight off the connection in one call
+                # (decompressed by urllib3) instead of being assembled
+                # chunk by chunk into response.content
+                with self._polite_get(search_url, params=params, stream=True,
+                                      headers={'Accept': 'application/json'}) as response:
+                    response.raise_for_status()
+                    listing = json_loads(response.raw.read(decode_content=True))['data']
+                
+                posts = listing['children'][:limit - seen]
+                seen += len(posts)
+                
+                for child in posts:
+                    # Missing or null fields fall back to defaults
+                    post = child['data']
+                    title = (post.get('title') or '').strip()
+                    text = (post.get('selftext') or '').strip()
+                    score = str(post.get('score', 0))
                     
-                    # Extract timestamp
-                    time_element = post.find('time')
-                    timestamp = time_element.get('datetime') if time_element else datetime.now().isoformat()
+                    created = post.get('created_utc')
+                    timestamp = (datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+                                 if created is not None else datetime.now(timezone.utc).isoformat())
                     
                     # Combine title and text for analysis
                     combined_text = f"{title} {text}".strip()
                     
-                    if combined_text:  # Only add if there's actual content
-                        posts_data.append({
-                            'title': title,
-                            'text': text,
-                            'combined_text': combined_text,
-                            'score': score,
-                            'timestamp': timestamp,
-                            'source': 'reddit',
-                            'subreddit': subreddit,
-                            'topic': topic
-                        })
-                        
-                except Exception as e:
-                    print(f"Error processing post: {e}")
-                    continue
+                    if not combined_text:  # Only add if there's actual content
+                        continue
                     
-                time.sleep(self.delay)
+                    posts_data.append({
+                        'title': title,
+                        'text': text,
+                        'combined_text': combined_text,
+                        'score': score,
+                        'timestamp': timestamp,
+                        'source': 'reddit',
+                        'subreddit': subreddit,
+                        'topic': topic
+                    })
+                
+                after = listing.get('after')
+                if not posts or seen >= limit or not after:
+                    break
+                
+                params['after'] = after
+                params['count'] = seen
                 
         except Exception as e:
             print(f"Error scraping Reddit: {e}")
@@ -116,38 +253,36 @@ class WebScraper:
         
         news_data = []
         
-        for url in source_urls:
+        # Fetch every source at once; the sources are independent, so the
+        # total wait is the slowest response instead of the sum of all of them
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(source_urls)))) as executor:
+            pages = [executor.submit(self._fetch_tree, url) for url in source_urls]
+        
+        # Case-insensitive search for the topic, without lowercasing a copy of
+        # every headline
+        topic_re = re.compile(re.escape(topic), re.IGNORECASE)
+        seen_headlines = set()  # the same headline often appears in several places
+        
+        for url, page in zip(source_urls, pages):
+            # Same for every headline of this source
+            source = urlparse(url).netloc
+            now_iso = datetime.now(timezone.utc).isoformat()
+            
             try:
-                response = self.session.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Generic headline selectors (you may need to adjust for specific sites)
-                headline_selectors = [
-                    'h1', 'h2', 'h3',
-                    '.headline', '.title',
-                    '[data-testid="headline"]',
-                    'article h1', 'article h2'
-                ]
-                
-                for selector in headline_selectors:
-                    headlines = soup.select(selector)
-                    
-                    for headline in headlines:
-                        text = headline.get_text().strip()
-                        if len(text) > 10 and topic.lower() in text.lower():
-                            news_data.append({
-                                'title': text,
-                                'text': '',
-                                'combined_text': text,
-                                'score': '',
-                                'timestamp': datetime.now().isoformat(),
-                                'source': urlparse(url).netloc,
-                                'topic': topic
-                            })
-                
-                time.sleep(self.delay)
+                # Every headline element, once each, in document order
+                for headline in HEADLINE_XPATH(page.result()):
+                    text = headline.text_content().strip()
+                    if len(text) > 10 and text not in seen_headlines and topic_re.search(text):
+                        seen_headlines.add(text)
+                        news_data.append({
+                            'title': text,
+                            'text': '',
+                            'combined_text': text,
+                            'score': '',
+                            'timestamp': now_iso,
+                            'source': source,
+                            'topic': topic
+                        })
                 
             except Exception as e:
                 print(f"Error scraping {url}: {e}")
@@ -168,16 +303,22 @@ class WebScraper:
         if not text:
             return ""
             
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s,.!?-]', ' ', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove URLs and special characters (keeping basic punctuation) and
+        # collapse extra whitespace, all in one pass
+        return _CLEAN_RE.sub(' ', text).strip()
+    
+    @staticmethod
+    def clean_series(texts):
+        """
+        Clean a whole column of texts with the same rules as clean_text
         
-        return text.strip()
+        Args:
+            texts (pandas.Series): Raw texts (missing values become "")
+            
+        Returns:
+            pandas.Series: Cleaned texts
+        """
+        return texts.fillna('').astype(str).str.replace(_CLEAN_RE, ' ', regex=True).str.strip()
     
     def scrape_and_clean(self, sources_config):
         """
@@ -189,41 +330,58 @@ class WebScraper:
         Returns:
             pandas.DataFrame: Cleaned data ready for sentiment analysis
         """
-        all_data = []
-        
-        # Scrape Reddit if configured
-        if 'reddit' in sources_config:
-            reddit_config = sources_config['reddit']
-            reddit_data = self.scrape_reddit_comments(
-                reddit_config['subreddit'],
-                reddit_config['topic'],
-                reddit_config.get('limit', 50)
-            )
-            all_data.extend(reddit_data)
-        
-        # Scrape news if configured
-        if 'news' in sources_config:
-            news_config = sources_config['news']
-            news_data = self.scrape_news_headlines(
-                news_config['topic'],
-                news_config.get('urls', None)
-            )
-            all_data.extend(news_data)
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(all_data)
+        # The sources live on different hosts, so scrape them at the same
+        # time; results are still collected Reddit first, then news
+        scrapes = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Scrape Reddit if configured
+            if 'reddit' in sources_config:
+                reddit_config = sources_config['reddit']
+                scrapes.append(executor.submit(
+                    self.scrape_reddit_comments,
+                    reddit_config['subreddit'],
+                    reddit_config['topic'],
+                    reddit_config.get('limit', 50)
+                ))
+            
+            # Scrape news if configured
+            if 'news' in sources_config:
+                news_config = sources_config['news']
+                scrapes.append(executor.submit(
+                    self.scrape_news_headlines,
+                    news_config['topic'],
+                    news_config.get('urls', None)
+                ))
+        
+        # Put the records in time order before building the frame. This
+        # sorts the timestamp strings as text, which is only correct because
+        # both scrapers write every timestamp with datetime.isoformat() on
+        # an aware UTC datetime: always the +00:00 offset, whole seconds or
+        # six fractional digits. Any other offset (or a naive time) would
+        # sort wrongly, so keep that guarantee when adding a source. Each
+        # source comes back nearly sorted already (Reddit newest first, news
+        # in per-source blocks), so sorting it is close to a single pass,
+        # and the sorted sources are merged in one more.
+        by_time = itemgetter('timestamp')
+        all_data = list(heapq.merge(*(sorted(scrape.result(), key=by_time) for scrape in scrapes),
+                                    key=by_time))
+        
+        # Convert to DataFrame with a fixed column layout
+        df = pd.DataFrame.from_records(all_data, columns=POST_COLUMNS)
         
         if not df.empty:
             # Clean the text data
-            df['cleaned_text'] = df['combined_text'].apply(self.clean_text)
+            df['cleaned_text'] = self.clean_series(df['combined_text'])
             
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Convert timestamp to datetime. Every scraper writes ISO 8601 in
+            # UTC, so the format is given instead of inferred and utc=True
+            # only normalizes the +00:00 offsets to one datetime dtype.
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True)
             
-            # Remove empty texts
+            # Remove empty texts (the rows are already sorted by timestamp)
             df = df[df['cleaned_text'].str.len() > 0]
             
-            # Sort by timestamp
-            df = df.sort_values('timestamp')
+            # Compact column dtypes
+            df = df.astype(CLEANED_DTYPES)
             
         return df